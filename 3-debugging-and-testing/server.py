@@ -1,5 +1,6 @@
+import io
 import os
-from http.client import HTTPException
+import threading
 
 import uvicorn
 from fastmcp import FastMCP
@@ -9,6 +10,70 @@ HOST = os.getenv("MCP_HOST", "127.0.0.1")
 PORT = int(os.getenv("MCP_PORT", "8000"))
 FILE_PATH = 'c:/PersonalNoteManagerStorage/notes.txt'
 
+# Created once at import instead of on every store_note call
+try:
+    os.makedirs(os.path.dirname(FILE_PATH), exist_ok=True)
+except OSError:
+    # Not fatal here: store_note reports the error when it can't write the file
+    pass
+
+# Opened on first use and shared by every store_note call. Each call writes its
+# notes through the O_APPEND handle in a single unbuffered write, so they have
+# reached the OS by the time the tool reports success.
+_notes_file = None
+_notes_lock = threading.Lock()
+
+
+def _notes_handle():
+    """
+    Return the shared append handle, opening it on first use and again whenever the
+    notes file was replaced (e.g. by delete_note in another process). Call with
+    _notes_lock held.
+    """
+    global _notes_file
+    if _notes_file is not None and not _notes_file.closed:
+        try:
+            if os.stat(FILE_PATH).st_ino == os.fstat(_notes_file.fileno()).st_ino:
+                return _notes_file
+        except FileNotFoundError:
+            pass
+        _notes_file.close()
+    _notes_file = io.FileIO(FILE_PATH, "a")
+    return _notes_file
+
+
+def _append_notes(data: bytes):
+    """Append one or more newline-terminated notes to the notes file in a single write."""
+    with _notes_lock:
+        _notes_handle().write(data)
+
+
+_notes_cache = (None, None)  # (file signature, content) of the last read
+
+
+def _read_notes():
+    """
+    Read the notes file, or return None if it doesn't exist.
+    The file is only re-read when its inode, mtime or size changed since the last read.
+    """
+    global _notes_cache
+    try:
+        f = open(FILE_PATH, 'r', encoding='utf-8')
+    except FileNotFoundError:
+        return None
+
+    with f:
+        # The signature comes from the opened file, so a truncate or replace between
+        # looking at the path and reading it cannot make them disagree
+        st = os.fstat(f.fileno())
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached_key, content = _notes_cache
+        if cached_key != key:
+            content = f.read()
+            _notes_cache = (key, content)
+    return content
+
+
 mcp = FastMCP(name="PersonalNoteManager")
 
 @mcp.tool(description="Store a note in the personal note system")
@@ -23,14 +88,31 @@ def store_note(note: str) -> (bool, str):
         (bool, str): True and success message if stored, False and error message otherwise.
     """
     try:
-        os.makedirs(os.path.dirname(FILE_PATH), exist_ok=True)
-        with open(FILE_PATH, "a", encoding="utf-8") as f:
-            f.write(note + "\n")
+        _append_notes(note.encode("utf-8") + b"\n")
         return True, "Note stored successfully."
     except Exception as e:
         return False, f"Error storing note: {str(e)}"
 
 
+@mcp.tool(description="Store several notes at once in the personal note system")
+def store_notes_bulk(notes: list[str]) -> (bool, str):
+    """
+    Store several notes in the personal note system with a single write.
+
+    Args:
+        notes (list[str]): The notes to store.
+
+    Returns:
+        (bool, str): True and success message if stored, False and error message otherwise.
+    """
+    try:
+        if notes:
+            _append_notes(("\n".join(notes) + "\n").encode("utf-8"))
+        return True, f"{len(notes)} note(s) stored successfully."
+    except Exception as e:
+        return False, f"Error storing notes: {str(e)}"
+
+
 @mcp.resource("notes://all", description="Return all notes stored in personal note system")
 def get_all_notes() -> str:
     """
@@ -40,12 +122,10 @@ def get_all_notes() -> str:
         String containing all notes with their timestamps
     """
     try:
-        if not os.path.exists(FILE_PATH):
+        content = _read_notes()
+        if content is None:
             return "No notes found. The notes file doesn't exist yet."
 
-        with open(FILE_PATH, 'r', encoding='utf-8') as f:
-            content = f.read()
-
         if not content.strip():
             return "No notes found. The notes file is empty."
 
@@ -54,6 +134,18 @@ def get_all_notes() -> str:
         return f"Error retrieving notes: {str(e)}"
 
 
+_CLASSIFY_PROMPT = """Considering the notes present in the resource, classify them in specific classes:
+
+            1. URGENT - contains "urgent", "asap", "critical", "emergency"
+            2. WITH DEADLINES - mentions dates or "today", "tomorrow", "week", "month"
+            3. MEETING - contains "meeting", "call", "review", "report"
+            4. PERSONAL - personal tasks and reminders
+            5. OTHER - everything else
+            
+            Show each priority level as a section with bullet points.
+            """
+
+
 @mcp.prompt(name="Analyze notes", description="Analyze notes and return them as a classified list based on urgency and deadlines")
 def classify_notes_prompt() -> str:
     """
@@ -67,16 +159,7 @@ def classify_notes_prompt() -> str:
     Returns:
         String containing the prompt instructions
     """
-    return """Considering the notes present in the resource, classify them in specific classes:
-
-            1. URGENT - contains "urgent", "asap", "critical", "emergency"
-            2. WITH DEADLINES - mentions dates or "today", "tomorrow", "week", "month"
-            3. MEETING - contains "meeting", "call", "review", "report"
-            4. PERSONAL - personal tasks and reminders
-            5. OTHER - everything else
-            
-            Show each priority level as a section with bullet points.
-            """
+    return _CLASSIFY_PROMPT
 
 
 
@@ -84,19 +167,34 @@ def classify_notes_prompt() -> str:
 class OriginValidationMiddleware:
     def __init__(self, app, allowed_origins):
         self.app = app
-        self.allowed_origins = set(allowed_origins)
+        self.allowed_origins = frozenset(o.encode("ascii").lower() for o in allowed_origins)
 
     async def __call__(self, scope, receive, send):
         if scope["type"] == "http":
-            headers = dict(scope["headers"])
-            origin = headers.get(b"origin", b"").decode("utf-8").lower()
+            origin = b""
+            for name, value in scope["headers"]:
+                if name == b"origin":
+                    origin = value.lower()
+                    break
 
             # Reject if Origin present but not allowed (DNS rebinding protection)
             if origin and origin not in self.allowed_origins:
-                raise HTTPException(403, "Invalid Origin")
+                await self._reject(send)
+                return
 
         await self.app(scope, receive, send)
 
+    @staticmethod
+    async def _reject(send):
+        # Answer with a plain 403 directly: raising here would surface as a 500 with a traceback.
+        # The headers list is fresh on every call because outer middleware (CORS) appends to it.
+        await send({
+            "type": "http.response.start",
+            "status": 403,
+            "headers": [(b"content-type", b"text/plain"), (b"content-length", b"14")],
+        })
+        await send({"type": "http.response.body", "body": b"Invalid Origin"})
+
 
 if __name__ == "__main__":
     app = mcp.http_app(stateless_http=True)
@@ -1,7 +1,10 @@
+import asyncio
+import io
 import inspect
 import os
+import sys
+import threading
 from functools import wraps
-from http.client import HTTPException
 
 from starlette.middleware.cors import CORSMiddleware
 
@@ -26,20 +29,166 @@ ALLOWED_ORIGINS = [
 ]
 FILE_PATH = 'c:/PersonalNoteManagerStorage/notes.txt'
 
+DELETE_SCAN_BLOCK = 64 * 1024  # characters delete_note checks for a match at once
+
+
+# Created once at import instead of on every store_note call
+try:
+    os.makedirs(os.path.dirname(FILE_PATH), exist_ok=True)
+except OSError:
+    # Not fatal here: store_note reports the error when it can't write the file
+    pass
+
+# Opened on first use and shared by every store_note call. Each call writes its
+# notes through the O_APPEND handle in a single unbuffered write, so they have
+# reached the OS by the time the tool reports success.
+_notes_file = None
+_notes_lock = threading.Lock()
+
+
+def _notes_handle():
+    """
+    Return the shared append handle, opening it on first use and again whenever the
+    notes file was replaced (e.g. by delete_note in another process). Call with
+    _notes_lock held.
+    """
+    global _notes_file
+    if _notes_file is not None and not _notes_file.closed:
+        try:
+            if os.stat(FILE_PATH).st_ino == os.fstat(_notes_file.fileno()).st_ino:
+                return _notes_file
+        except FileNotFoundError:
+            pass
+        _notes_file.close()
+    _notes_file = io.FileIO(FILE_PATH, "a")
+    return _notes_file
+
+
+def _append_notes(data: bytes):
+    """Append one or more newline-terminated notes to the notes file in a single write."""
+    with _notes_lock:
+        _notes_handle().write(data)
+
+
+_notes_cache = (None, None)  # (file signature, content) of the last read
+
+
+def _read_notes():
+    """
+    Read the notes file, or return None if it doesn't exist.
+    The file is only re-read when its inode, mtime or size changed since the last read.
+    """
+    global _notes_cache
+    try:
+        f = open(FILE_PATH, 'r', encoding='utf-8')
+    except FileNotFoundError:
+        return None
+
+    with f:
+        # The signature comes from the opened file, so a truncate or replace between
+        # looking at the path and reading it cannot make them disagree
+        st = os.fstat(f.fileno())
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached_key, content = _notes_cache
+        if cached_key != key:
+            content = f.read()
+            _notes_cache = (key, content)
+    return content
+
+
+def _clear_notes():
+    """Empty the notes file."""
+    with _notes_lock:
+        try:
+            os.truncate(FILE_PATH, 0)
+        except FileNotFoundError:
+            pass
+
+
+def _delete_notes_containing(contained_text: str) -> int:
+    """
+    Stream the notes file into a sibling temp file, leaving out every note that
+    contains the given text, then atomically swap the temp file in if any note
+    was left out.
+
+    Returns:
+        Number of deleted notes
+    """
+    # Unique per process, as other example servers may share the notes file
+    tmp_path = f"{FILE_PATH}.{os.getpid()}.tmp"
+    deleted_count = 0
+
+    # Held from read to swap, so concurrent deletes and appends run one at a time
+    with _notes_lock:
+        try:
+            with open(FILE_PATH, "r", encoding="utf-8", newline="") as src, \
+                    open(tmp_path, "w", encoding="utf-8", newline="") as dst:
+                while True:
+                    # Check a block of whole lines at once: a block without the text
+                    # is copied as-is, only blocks with a match are filtered per line
+                    block = src.read(DELETE_SCAN_BLOCK)
+                    if not block:
+                        break
+                    if not block.endswith("\n"):
+                        block += src.readline()
+
+                    if contained_text not in block:
+                        dst.write(block)
+                        continue
+
+                    for line in io.StringIO(block, newline=""):
+                        if contained_text in line:
+                            deleted_count += 1
+                        else:
+                            dst.write(line)
+
+            if deleted_count:
+                # The append handle must not stay open on the file being replaced;
+                # the next append reopens it on the new file
+                if _notes_file is not None:
+                    _notes_file.close()
+                os.replace(tmp_path, FILE_PATH)
+        finally:
+            # Left behind when nothing matched or the rewrite failed
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    return deleted_count
+
+
 mcp = FastMCP("PersonalNoteManager")
 
 
+_INSTANCE_LOG_LINE = f"[MCP CALL] instance={INSTANCE_ID}\n"
+_INSTANCE_LOG_BYTES = _INSTANCE_LOG_LINE.encode()
+
+
+def _log_instance_call():
+    # Written straight to the stderr file descriptor: one unbuffered write per call,
+    # without print() formatting or the sys.stdout lock. The descriptor is looked up
+    # per call because stderr may have none (pythonw, captured or replaced streams)
+    try:
+        os.write(sys.stderr.fileno(), _INSTANCE_LOG_BYTES)
+    except (AttributeError, ValueError, OSError):
+        if sys.stderr is not None:
+            sys.stderr.write(_INSTANCE_LOG_LINE)
+
+
 def instance_logger_wrapper(fn):
+    # Without an INSTANCE_ID there is no instance to report, so skip the wrapper
+    if INSTANCE_ID == "unknown":
+        return fn
+
     is_async = inspect.iscoroutinefunction(fn)
 
     @wraps(fn)
     async def async_wrapped(*args, **kwargs):
-        print(f"[MCP CALL] instance={INSTANCE_ID}")
+        _log_instance_call()
         return await fn(*args, **kwargs)
 
     @wraps(fn)
     def sync_wrapped(*args, **kwargs):
-        print(f"[MCP CALL] instance={INSTANCE_ID}")
+        _log_instance_call()
         return fn(*args, **kwargs)
 
     return async_wrapped if is_async else sync_wrapped
@@ -57,14 +206,32 @@ def store_note(note: str) -> (bool, str):
         (bool, str): True and success message if stored, False and error message otherwise.
     """
     try:
-        os.makedirs(os.path.dirname(FILE_PATH), exist_ok=True)
-        with open(FILE_PATH, "a", encoding="utf-8") as f:
-            f.write(note + "\n")
+        _append_notes(note.encode("utf-8") + b"\n")
         return True, "Note stored successfully."
     except Exception as e:
         return False, f"Error storing note: {str(e)}"
 
 
+@mcp.tool(description="Store several notes at once in the personal note system")
+@instance_logger_wrapper
+def store_notes_bulk(notes: list[str]) -> (bool, str):
+    """
+    Store several notes in the personal note system with a single write.
+
+    Args:
+        notes (list[str]): The notes to store.
+
+    Returns:
+        (bool, str): True and success message if stored, False and error message otherwise.
+    """
+    try:
+        if notes:
+            _append_notes(("\n".join(notes) + "\n").encode("utf-8"))
+        return True, f"{len(notes)} note(s) stored successfully."
+    except Exception as e:
+        return False, f"Error storing notes: {str(e)}"
+
+
 @mcp.resource("notes://all", description="Return all notes stored in personal note system")
 @instance_logger_wrapper
 def get_all_notes() -> str:
@@ -75,12 +242,10 @@ def get_all_notes() -> str:
         String containing all notes with their timestamps
     """
     try:
-        if not os.path.exists(FILE_PATH):
+        content = _read_notes()
+        if content is None:
             return "No notes found. The notes file doesn't exist yet."
 
-        with open(FILE_PATH, 'r', encoding='utf-8') as f:
-            content = f.read()
-
         if not content.strip():
             return "No notes found. The notes file is empty."
 
@@ -89,6 +254,18 @@ def get_all_notes() -> str:
         return f"Error retrieving notes: {str(e)}"
 
 
+_CLASSIFY_PROMPT = """Considering the notes present in the resource, classify them in specific classes:
+
+            1. URGENT - contains "urgent", "asap", "critical", "emergency"
+            2. WITH DEADLINES - mentions dates or "today", "tomorrow", "week", "month"
+            3. MEETING - contains "meeting", "call", "review", "report"
+            4. PERSONAL - personal tasks and reminders
+            5. OTHER - everything else
+            
+            Show each priority level as a section with bullet points.
+            """
+
+
 @mcp.prompt(name="Analyze notes", description="Analyze notes and return them as a classified list based on urgency and deadlines")
 @instance_logger_wrapper
 def classify_notes_prompt() -> str:
@@ -103,16 +280,34 @@ def classify_notes_prompt() -> str:
     Returns:
         String containing the prompt instructions
     """
-    return """Considering the notes present in the resource, classify them in specific classes:
+    return _CLASSIFY_PROMPT
+
+# Fixed responses shared by the delete tools
+_ALL_NOTES_DELETED = {
+    "status": "success",
+    "message": "All notes have been deleted.",
+}
+_NO_NOTES_FILE = {
+    "status": "success",
+    "message": "No notes file found. Nothing to delete.",
+}
+_DELETION_NOT_CONFIRMED = {
+    "status": "cancelled",
+    "message": "Deletion not confirmed by user.",
+}
+_DELETION_DECLINED = {
+    "status": "cancelled",
+    "message": "Deletion declined by user.",
+}
+_DELETION_CANCELLED = {
+    "status": "cancelled",
+    "message": "Deletion cancelled by user.",
+}
+_INVALID_CONFIRMATION = {
+    "status": "error",
+    "message": "Invalid confirmation response.",
+}
 
-            1. URGENT - contains "urgent", "asap", "critical", "emergency"
-            2. WITH DEADLINES - mentions dates or "today", "tomorrow", "week", "month"
-            3. MEETING - contains "meeting", "call", "review", "report"
-            4. PERSONAL - personal tasks and reminders
-            5. OTHER - everything else
-            
-            Show each priority level as a section with bullet points.
-            """
 
 @mcp.tool(description="Delete all stored notes in the personal note system")
 @instance_logger_wrapper
@@ -127,14 +322,9 @@ async def delete_all_notes(ctx: Context) -> dict:
 
             if confirmed is True:
                 try:
-                    if os.path.exists(FILE_PATH):
-                        with open(FILE_PATH, "w", encoding="utf-8"):
-                            pass
+                    await asyncio.to_thread(_clear_notes)
 
-                    return {
-                        "status": "success",
-                        "message": "All notes have been deleted.",
-                    }
+                    return _ALL_NOTES_DELETED
 
                 except Exception as e:
                     return {
@@ -143,27 +333,15 @@ async def delete_all_notes(ctx: Context) -> dict:
                     }
 
             elif confirmed is False:
-                return {
-                    "status": "cancelled",
-                    "message": "Deletion not confirmed by user.",
-                }
+                return _DELETION_NOT_CONFIRMED
 
     if result.action == "decline":
-        return {
-            "status": "cancelled",
-            "message": "Deletion declined by user.",
-        }
+        return _DELETION_DECLINED
 
     elif result.action == "cancel":
-        return {
-            "status": "cancelled",
-            "message": "Deletion cancelled by user.",
-        }
+        return _DELETION_CANCELLED
     else:
-        return {
-            "status": "error",
-            "message": "Invalid confirmation response.",
-        }
+        return _INVALID_CONFIRMATION
 
 @mcp.tool(description="Delete notes, stored in the personal note system, that contains specific text")
 @instance_logger_wrapper
@@ -184,70 +362,61 @@ async def delete_note(contained_text: str, ctx: Context) -> dict:
 
             if confirmed is True:
                 try:
-                    if not os.path.exists(FILE_PATH):
-                        return {
-                            "status": "success",
-                            "message": "No notes file found. Nothing to delete.",
-                        }
-
-                    with open(FILE_PATH, "r", encoding="utf-8") as f:
-                        lines = f.readlines()
-
-                    # Keep only lines that DO NOT contain the text
-                    remaining_lines = [
-                        line for line in lines if contained_text not in line
-                    ]
-
-                    deleted_count = len(lines) - len(remaining_lines)
-
-                    with open(FILE_PATH, "w", encoding="utf-8") as f:
-                        f.writelines(remaining_lines)
+                    deleted_count = await asyncio.to_thread(_delete_notes_containing, contained_text)
 
                     return {
                         "status": "success",
                         "deleted": deleted_count,
                         "message": f"Deleted {deleted_count} note(s) containing '{contained_text}'.",
                     }
+                except FileNotFoundError:
+                    return _NO_NOTES_FILE
                 except Exception as e:
                     return {
                         "status": "error",
                         "message": f"Failed to delete notes: {str(e)}",
                     }
             else:
-                return {
-                    "status": "cancelled",
-                    "message": "Deletion declined by user.",
-                }
+                return _DELETION_DECLINED
 
         case DeclinedElicitation():
-            return {
-                "status": "cancelled",
-                "message": "Deletion declined by user.",
-            }
+            return _DELETION_DECLINED
 
         case CancelledElicitation():
-            return {
-                "status": "cancelled",
-                "message": "Deletion cancelled by user.",
-            }
+            return _DELETION_CANCELLED
 
 
 class OriginValidationMiddleware:
     def __init__(self, app, allowed_origins):
         self.app = app
-        self.allowed_origins = set(allowed_origins)
+        self.allowed_origins = frozenset(o.encode("ascii").lower() for o in allowed_origins)
 
     async def __call__(self, scope, receive, send):
         if scope["type"] == "http":
-            headers = dict(scope["headers"])
-            origin = headers.get(b"origin", b"").decode("utf-8").lower()
+            origin = b""
+            for name, value in scope["headers"]:
+                if name == b"origin":
+                    origin = value.lower()
+                    break
 
             # Reject if Origin present but not allowed (DNS rebinding protection)
             if origin and origin not in self.allowed_origins:
-                raise HTTPException(403, "Invalid Origin")
+                await self._reject(send)
+                return
 
         await self.app(scope, receive, send)
 
+    @staticmethod
+    async def _reject(send):
+        # Answer with a plain 403 directly: raising here would surface as a 500 with a traceback.
+        # The headers list is fresh on every call because outer middleware (CORS) appends to it.
+        await send({
+            "type": "http.response.start",
+            "status": 403,
+            "headers": [(b"content-type", b"text/plain"), (b"content-length", b"14")],
+        })
+        await send({"type": "http.response.body", "body": b"Invalid Origin"})
+
 
 if __name__ == "__main__":
     app = mcp.http_app()
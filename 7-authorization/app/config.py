@@ -1,10 +1,13 @@
 import base64
+import functools
 import hashlib
 import os
 
 
 class Config:
     """Application configuration."""
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
     def derive_fernet_key(input_string: str) -> bytes:
         # 1. Hash the string to get exactly 32 bytes
         digest = hashlib.sha256(input_string.encode()).digest()
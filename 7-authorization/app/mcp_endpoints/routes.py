@@ -1,13 +1,70 @@
+import asyncio
+
 from fastmcp import Context, FastMCP
-from fastmcp.server.elicitation import (
-    AcceptedElicitation,
-    DeclinedElicitation,
-    CancelledElicitation,
-)
 from app.services.note_service import NoteService
 from app.security.auth import has_role
 
 
+# Fixed responses shared by the delete tools
+_DELETION_NOT_CONFIRMED = {
+    "status": "cancelled",
+    "message": "Deletion not confirmed by user.",
+}
+_DELETION_DECLINED = {
+    "status": "cancelled",
+    "message": "Deletion declined by user.",
+}
+_DELETION_CANCELLED = {
+    "status": "cancelled",
+    "message": "Deletion cancelled by user.",
+}
+_INVALID_CONFIRMATION = {
+    "status": "error",
+    "message": "Invalid confirmation response.",
+}
+
+_DELETE_ALL_CONFIRM_MESSAGE = "Are you sure you want to delete ALL notes?"
+_DELETE_CONFIRM_TEMPLATE = "Are you sure you want to delete all notes containing: '{}'?"
+
+
+async def _confirm_deletion(ctx: Context, message: str):
+    """
+    Ask the user to confirm a deletion through elicitation.
+
+    Args:
+        ctx: MCP context for elicitation
+        message: The confirmation question shown to the user
+
+    Returns:
+        The elicitation result
+    """
+    return await ctx.elicit(message=message, response_type=bool)
+
+
+async def _handle_delete_accept(result, contained_text: str) -> dict:
+    if result.data is True:
+        return await asyncio.to_thread(NoteService.delete_notes_containing, contained_text)
+    return _DELETION_DECLINED
+
+
+async def _handle_delete_decline(result, contained_text: str) -> dict:
+    return _DELETION_DECLINED
+
+
+async def _handle_delete_cancel(result, contained_text: str) -> dict:
+    return _DELETION_CANCELLED
+
+
+# Elicitation action -> handler, so delete_note resolves its branch with one lookup.
+# Keyed on the action rather than the result class: fastmcp returns parametrized
+# subclasses such as AcceptedElicitation[Any], which an exact type lookup misses.
+_ELICIT_HANDLERS = {
+    "accept": _handle_delete_accept,
+    "decline": _handle_delete_decline,
+    "cancel": _handle_delete_cancel,
+}
+
+
 def register_routes(mcp: FastMCP):
     """
     Register all MCP routes (tools, resources, prompts) with the FastMCP instance.
@@ -15,10 +72,14 @@ def register_routes(mcp: FastMCP):
     Args:
         mcp: FastMCP instance
     """
+    # One checker per role, shared by every route that requires it
+    auth_read = has_role("mcp_read")
+    auth_write = has_role("mcp_write")
+    auth_delete = has_role("mcp_delete")
 
     @mcp.tool(
         description="Store a note in the personal note system",
-        auth=has_role("mcp_write")
+        auth=auth_write
     )
     def store_note(note: str) -> tuple:
         """
@@ -32,10 +93,26 @@ def register_routes(mcp: FastMCP):
         """
         return NoteService.store_note(note)
 
+    @mcp.tool(
+        description="Store several notes at once in the personal note system",
+        auth=auth_write
+    )
+    def store_notes_bulk(notes: list[str]) -> tuple:
+        """
+        Store several notes in the personal note system with a single write.
+
+        Args:
+            notes (list[str]): The notes to store.
+
+        Returns:
+            (bool, str): True and success message if stored, False and error message otherwise.
+        """
+        return NoteService.store_notes_bulk(notes)
+
     @mcp.resource(
         "notes://all",
         description="Return all notes stored in personal note system",
-        auth=has_role("mcp_read")
+        auth=auth_read
     )
     def get_all_notes() -> str:
         """
@@ -49,7 +126,7 @@ def register_routes(mcp: FastMCP):
     @mcp.prompt(
         name="Analyze notes",
         description="Analyze notes and return them as a classified list based on urgency and deadlines",
-        auth=has_role("mcp_read")
+        auth=auth_read
     )
     def classify_notes_prompt() -> str:
         """
@@ -67,14 +144,14 @@ def register_routes(mcp: FastMCP):
 
     @mcp.tool(
         description="Analyze notes and return them as a classified list based on urgency and deadlines",
-        auth=has_role("mcp_read")
+        auth=auth_read
     )
     async def classify_stored_notes(ctx: Context) -> str:
         """
         Classifies stored notes into categories: URGENT, WITH DEADLINES, MEETING, PERSONAL, OTHER
         """
         try:
-            notes_content = NoteService.read_notes_content()
+            notes_content = await asyncio.to_thread(NoteService.read_notes_content)
         except Exception as e:
             return str(e)
 
@@ -93,7 +170,7 @@ def register_routes(mcp: FastMCP):
 
     @mcp.tool(
         description="Delete all stored notes in the personal note system",
-        auth=has_role("mcp_delete")
+        auth=auth_delete
     )
     async def delete_all_notes(ctx: Context) -> dict:
         """
@@ -105,42 +182,27 @@ def register_routes(mcp: FastMCP):
         Returns:
             Dictionary with status and message
         """
-        result = await ctx.elicit(
-            "Are you sure you want to delete ALL notes?",
-            response_type=bool,
-        )
+        result = await _confirm_deletion(ctx, _DELETE_ALL_CONFIRM_MESSAGE)
 
         if result.action == "accept":
             confirmed = result.data
 
             if confirmed is True:
-                return NoteService.delete_all_notes()
+                return await asyncio.to_thread(NoteService.delete_all_notes)
             elif confirmed is False:
-                return {
-                    "status": "cancelled",
-                    "message": "Deletion not confirmed by user.",
-                }
+                return _DELETION_NOT_CONFIRMED
 
         if result.action == "decline":
-            return {
-                "status": "cancelled",
-                "message": "Deletion declined by user.",
-            }
+            return _DELETION_DECLINED
 
         elif result.action == "cancel":
-            return {
-                "status": "cancelled",
-                "message": "Deletion cancelled by user.",
-            }
+            return _DELETION_CANCELLED
         else:
-            return {
-                "status": "error",
-                "message": "Invalid confirmation response.",
-            }
+            return _INVALID_CONFIRMATION
 
     @mcp.tool(
         description="Delete notes, stored in the personal note system, that contains specific text",
-        auth=has_role("mcp_delete")
+        auth=auth_delete
     )
     async def delete_note(contained_text: str, ctx: Context) -> dict:
         """
@@ -154,31 +216,10 @@ def register_routes(mcp: FastMCP):
             Dictionary with status and message
         """
         # Ask for confirmation
-        result = await ctx.elicit(
-            message=f"Are you sure you want to delete all notes containing: '{contained_text}'?",
-            response_type=bool,
-        )
+        result = await _confirm_deletion(ctx, _DELETE_CONFIRM_TEMPLATE.format(contained_text))
+
+        handler = _ELICIT_HANDLERS.get(result.action)
+        if handler is None:
+            return _INVALID_CONFIRMATION
 
-        match result:
-            case AcceptedElicitation():
-                confirmed = result.data
-
-                if confirmed is True:
-                    return NoteService.delete_notes_containing(contained_text)
-                else:
-                    return {
-                        "status": "cancelled",
-                        "message": "Deletion declined by user.",
-                    }
-
-            case DeclinedElicitation():
-                return {
-                    "status": "cancelled",
-                    "message": "Deletion declined by user.",
-                }
-
-            case CancelledElicitation():
-                return {
-                    "status": "cancelled",
-                    "message": "Deletion cancelled by user.",
-                }
\ No newline at end of file
+        return await handler(result, contained_text)
@@ -1,9 +1,13 @@
+import functools
+import hashlib
+
 from fastmcp.server.auth import OIDCProxy
 from app.config import Config
 from app.storage import get_encrypted_store
 
 
 
+@functools.lru_cache(maxsize=1)
 def get_auth_proxy() -> OIDCProxy:
     """Create and return an OIDC authentication proxy."""
     return OIDCProxy(
@@ -17,6 +21,46 @@ def get_auth_proxy() -> OIDCProxy:
     )
 
 
+_ROLES_CACHE_SIZE = 1024
+_roles_cache = {}  # SHA-256 digest of the access token -> frozenset of its lowercase realm roles
+
+
+def _token_roles(token) -> frozenset:
+    """
+    Return the lowercase Keycloak realm roles of an access token.
+
+    The claims of a token never change, so the roles are parsed once per token and
+    kept in a bounded cache (the oldest entry is dropped when it is full). The cache
+    is keyed on a digest of the token, so no bearer token outlives its request.
+    They are also memoized on the token object itself, so the several checks run
+    for one request (e.g. filtering the tool list) skip even the cache lookup.
+
+    Args:
+        token: The access token of the current request
+
+    Returns:
+        Frozenset of lowercase role names
+    """
+    roles = getattr(token, "_realm_roles", None)
+    if roles is not None:
+        return roles
+
+    key = hashlib.sha256(token.token.encode()).digest()
+    roles = _roles_cache.get(key)
+    if roles is None:
+        roles = frozenset(r.lower() for r in token.claims.get("realm_access", {}).get("roles", []))
+        if len(_roles_cache) >= _ROLES_CACHE_SIZE:
+            _roles_cache.pop(next(iter(_roles_cache)), None)
+        _roles_cache[key] = roles
+
+    try:
+        token._realm_roles = roles
+    except (AttributeError, TypeError, ValueError):
+        pass
+    return roles
+
+
+@functools.lru_cache(maxsize=None)
 def has_role(role: str):
     """
     Create an authorization checker that validates if the user has a specific role.
@@ -26,12 +70,12 @@ def has_role(role: str):
         role: The role name to check for
 
     Returns:
-        A function that checks if the context token contains the specified role
+        A function that checks if the context token contains the specified role.
+        The same function is returned for every call with the same role.
     """
+    role_lc = role.lower()
 
     def check(ctx) -> bool:
-        token = ctx.token
-        roles = [x.lower() for x in token.claims.get("realm_access", {}).get("roles", [])]
-        return role.lower() in roles
+        return role_lc in _token_roles(ctx.token)
 
     return check
\ No newline at end of file
@@ -1,5 +1,27 @@
-from http.client import HTTPException
-from urllib.parse import urlparse
+def _split_origin(origin: bytes):
+    """
+    Split an Origin header value into its scheme and hostname.
+
+    Args:
+        origin: Lowercased raw Origin header value, e.g. b"http://localhost:6274"
+
+    Returns:
+        Tuple of (scheme, hostname) as bytes, or None if the value has no scheme
+    """
+    scheme, sep, rest = origin.partition(b"://")
+    if not sep:
+        return None
+
+    netloc = rest.split(b"/", 1)[0].split(b"?", 1)[0].split(b"#", 1)[0]
+    host = netloc.rpartition(b"@")[2]
+
+    if host.startswith(b"["):
+        # IPv6 literal: the hostname is what is inside the brackets
+        host = host[1:].partition(b"]")[0]
+    else:
+        host = host.partition(b":")[0]
+
+    return scheme, host
 
 
 class HostOriginValidationMiddleware:
@@ -17,7 +39,7 @@ class HostOriginValidationMiddleware:
             allowed_hosts: List of allowed hostnames
         """
         self.app = app
-        self.allowed_hosts = set(h.lower() for h in allowed_hosts)
+        self.allowed_hosts = frozenset(h.lower().encode("ascii") for h in allowed_hosts)
 
     async def __call__(self, scope, receive, send):
         """
@@ -28,20 +50,44 @@ class HostOriginValidationMiddleware:
             receive: ASGI receive callable
             send: ASGI send callable
         """
-        if scope["type"] == "http":
-            headers = dict(scope["headers"])
-            origin = headers.get(b"origin")
+        # Lifespan and websocket events go straight through
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        origin = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+                break
 
-            if origin:
-                origin = origin.decode().lower()
-                parsed = urlparse(origin)
+        # No Origin header (e.g. same-origin or non-browser clients): nothing to validate
+        if not origin:
+            return await self.app(scope, receive, send)
 
-                # Optional: enforce scheme
-                if parsed.scheme not in ("http", "https"):
-                    raise HTTPException(403, "Invalid Origin")
+        parsed = _split_origin(origin.lower())
 
-                # DNS rebinding protection
-                if parsed.hostname not in self.allowed_hosts:
-                    raise HTTPException(403, "Invalid Origin")
+        # Optional: enforce scheme
+        if parsed is None or parsed[0] not in (b"http", b"https"):
+            return await self._reject(send)
 
-        await self.app(scope, receive, send)
\ No newline at end of file
+        # DNS rebinding protection
+        if parsed[1] not in self.allowed_hosts:
+            return await self._reject(send)
+
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    async def _reject(send):
+        """
+        Answer the request with a 403 directly on the ASGI channel.
+
+        Args:
+            send: ASGI send callable
+        """
+        # Headers are built per call: the outer CORS middleware appends to this list
+        await send({
+            "type": "http.response.start",
+            "status": 403,
+            "headers": [(b"content-type", b"text/plain"), (b"content-length", b"14")],
+        })
+        await send({"type": "http.response.body", "body": b"Invalid Origin"})
\ No newline at end of file
@@ -1,8 +1,108 @@
 """Business logic for note management operations."""
 import os
-from typing import Tuple
+import shutil
+import tempfile
+import threading
+from typing import List, Tuple
 from app.config import Config
 
+# Created once at import instead of on every store_note call
+try:
+    os.makedirs(os.path.dirname(Config.FILE_PATH), exist_ok=True)
+except OSError:
+    # Not fatal here: store_note reports the error when it can't write the file
+    pass
+
+# Append handle opened on first use and kept open, so storing a note is a single write
+_notes_file = None
+_notes_lock = threading.RLock()
+
+
+def _append_to_notes(data: bytes):
+    """
+    Append raw bytes to the notes file.
+
+    Args:
+        data: The encoded note(s) to append
+    """
+    global _notes_file
+    with _notes_lock:
+        if _notes_file is not None:
+            # The notes file may have been replaced or removed since the handle was
+            # opened (e.g. by another example server sharing it): writing through the
+            # old handle would append to the unlinked file
+            try:
+                stale = os.stat(Config.FILE_PATH).st_ino != os.fstat(_notes_file.fileno()).st_ino
+            except FileNotFoundError:
+                stale = True
+            if stale:
+                _notes_file.close()
+                _notes_file = None
+
+        if _notes_file is None:
+            _notes_file = open(Config.FILE_PATH, "ab", buffering=64 * 1024)
+        _notes_file.write(data)
+        _notes_file.flush()
+
+
+def _replace_notes(data: bytes):
+    """
+    Atomically replace the content of the notes file.
+
+    The data is written and fsynced to a temp file next to the notes file, which is
+    then renamed over it: a crash never leaves a half-written notes file behind.
+
+    Args:
+        data: The new content of the notes file
+    """
+    global _notes_file
+    with _notes_lock:
+        # The append handle would keep pointing at the replaced file
+        if _notes_file is not None:
+            _notes_file.close()
+            _notes_file = None
+
+        tmp = tempfile.NamedTemporaryFile("wb", dir=os.path.dirname(Config.FILE_PATH), delete=False)
+        try:
+            with tmp:
+                tmp.write(data)
+                tmp.flush()
+                os.fsync(tmp.fileno())
+            # The temp file is created 0600: keep the permissions of the notes file
+            shutil.copymode(Config.FILE_PATH, tmp.name)
+            os.replace(tmp.name, Config.FILE_PATH)
+        except BaseException:
+            os.unlink(tmp.name)
+            raise
+
+
+_CLASSIFY_PROMPT = """Considering the notes present in the resource, classify them in specific classes:
+
+            1. URGENT - contains "urgent", "asap", "critical", "emergency"
+            2. WITH DEADLINES - mentions dates or "today", "tomorrow", "week", "month"
+            3. MEETING - contains "meeting", "call", "review", "report"
+            4. PERSONAL - personal tasks and reminders
+            5. OTHER - everything else
+
+            Show each priority level as a section with bullet points.
+            """
+
+# The classification message is the prompt followed by the notes: only the
+# notes change per call, so the rest is kept as prebuilt head and tail strings
+_CLASSIFY_MESSAGE_HEAD = """Considering the notes present in the resource, classify them in specific classes:
+
+            1. URGENT - contains "urgent", "asap", "critical", "emergency"
+            2. WITH DEADLINES - mentions dates or "today", "tomorrow", "week", "month"
+            3. MEETING - contains "meeting", "call", "review", "report"
+            4. PERSONAL - personal tasks and reminders
+            5. OTHER - everything else
+
+            Show each priority level as a section with bullet points.
+            ------------
+            DATA TO PROCESS:
+"""
+_CLASSIFY_MESSAGE_TAIL = "\n        "
+
 
 class NoteService:
     """Service class for managing notes."""
@@ -19,13 +119,29 @@ class NoteService:
             Tuple of (success: bool, message: str)
         """
         try:
-            os.makedirs(os.path.dirname(Config.FILE_PATH), exist_ok=True)
-            with open(Config.FILE_PATH, "a", encoding="utf-8") as f:
-                f.write(note + "\n")
+            _append_to_notes(note.encode("utf-8") + b"\n")
             return True, "Note stored successfully."
         except Exception as e:
             return False, f"Error storing note: {str(e)}"
 
+    @staticmethod
+    def store_notes_bulk(notes: List[str]) -> Tuple[bool, str]:
+        """
+        Store several notes in the personal note system with a single write.
+
+        Args:
+            notes: The notes to store.
+
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        try:
+            if notes:
+                _append_to_notes(("\n".join(notes) + "\n").encode("utf-8"))
+            return True, f"{len(notes)} note(s) stored successfully."
+        except Exception as e:
+            return False, f"Error storing notes: {str(e)}"
+
     @staticmethod
     def get_all_notes() -> str:
         """
@@ -35,12 +151,12 @@ class NoteService:
             String containing all notes with their timestamps
         """
         try:
-            if not os.path.exists(Config.FILE_PATH):
+            try:
+                with open(Config.FILE_PATH, 'r', encoding='utf-8') as f:
+                    content = f.read()
+            except FileNotFoundError:
                 return "No notes found. The notes file doesn't exist yet."
 
-            with open(Config.FILE_PATH, 'r', encoding='utf-8') as f:
-                content = f.read()
-
             if not content.strip():
                 return "No notes found. The notes file is empty."
 
@@ -57,14 +173,13 @@ class NoteService:
             String containing the notes content or empty string if file doesn't exist
         """
         try:
-            if os.path.exists(Config.FILE_PATH):
-                with open(Config.FILE_PATH, 'r', encoding='utf-8') as f:
-                    return f.read()
+            with open(Config.FILE_PATH, 'r', encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            return ""
         except Exception as e:
             raise Exception(f"Error retrieving notes: {str(e)}")
 
-        return ""
-
     @staticmethod
     def delete_all_notes() -> dict:
         """
@@ -74,9 +189,11 @@ class NoteService:
             Dictionary with status and message
         """
         try:
-            if os.path.exists(Config.FILE_PATH):
-                with open(Config.FILE_PATH, "w", encoding="utf-8"):
-                    pass
+            # Held so the truncate cannot land in the middle of delete_notes_containing
+            with _notes_lock:
+                if os.path.exists(Config.FILE_PATH):
+                    with open(Config.FILE_PATH, "w", encoding="utf-8"):
+                        pass
 
             return {
                 "status": "success",
@@ -99,31 +216,48 @@ class NoteService:
         Returns:
             Dictionary with status, deleted count, and message
         """
+        # An empty text is contained in every note and would silently wipe them all
+        if not contained_text:
+            return {
+                "status": "error",
+                "message": "The text to search for must not be empty. Use delete_all_notes to delete every note.",
+            }
+
         try:
-            if not os.path.exists(Config.FILE_PATH):
-                return {
-                    "status": "success",
-                    "message": "No notes file found. Nothing to delete.",
-                }
+            needle = contained_text.encode("utf-8")
+            deleted_count = 0
 
-            with open(Config.FILE_PATH, "r", encoding="utf-8") as f:
-                lines = f.readlines()
+            # Held from read to replace so no note stored meanwhile gets lost
+            with _notes_lock:
+                with open(Config.FILE_PATH, "rb") as f:
+                    data = f.read()
 
-            # Keep only lines that DO NOT contain the text
-            remaining_lines = [
-                line for line in lines if contained_text not in line
-            ]
+                # One scan of the whole file tells whether any note can match at all
+                if needle in data:
+                    lines = data.splitlines(keepends=True)
 
-            deleted_count = len(lines) - len(remaining_lines)
+                    # Keep only lines that DO NOT contain the text, matching on the raw
+                    # UTF-8 bytes so no line has to be decoded
+                    remaining_lines = [
+                        line for line in lines if needle not in line
+                    ]
 
-            with open(Config.FILE_PATH, "w", encoding="utf-8") as f:
-                f.writelines(remaining_lines)
+                    deleted_count = len(lines) - len(remaining_lines)
+
+                # Leave the file untouched when nothing was deleted
+                if deleted_count:
+                    _replace_notes(b"".join(remaining_lines))
 
             return {
                 "status": "success",
                 "deleted": deleted_count,
                 "message": f"Deleted {deleted_count} note(s) containing '{contained_text}'.",
             }
+        except FileNotFoundError:
+            return {
+                "status": "success",
+                "message": "No notes file found. Nothing to delete.",
+            }
         except Exception as e:
             return {
                 "status": "error",
@@ -138,16 +272,7 @@ class NoteService:
         Returns:
             String containing the classification prompt
         """
-        return """Considering the notes present in the resource, classify them in specific classes:
-
-            1. URGENT - contains "urgent", "asap", "critical", "emergency"
-            2. WITH DEADLINES - mentions dates or "today", "tomorrow", "week", "month"
-            3. MEETING - contains "meeting", "call", "review", "report"
-            4. PERSONAL - personal tasks and reminders
-            5. OTHER - everything else
-
-            Show each priority level as a section with bullet points.
-            """
+        return _CLASSIFY_PROMPT
 
     @staticmethod
     def build_classification_message(notes_content: str) -> str:
@@ -160,15 +285,4 @@ class NoteService:
         Returns:
             Formatted message for AI classification
         """
-        return f"""Considering the notes present in the resource, classify them in specific classes:
-
-            1. URGENT - contains "urgent", "asap", "critical", "emergency"
-            2. WITH DEADLINES - mentions dates or "today", "tomorrow", "week", "month"
-            3. MEETING - contains "meeting", "call", "review", "report"
-            4. PERSONAL - personal tasks and reminders
-            5. OTHER - everything else
-
-            Show each priority level as a section with bullet points.
-            ------------
-            DATA TO PROCESS:\n{notes_content}
-        """
\ No newline at end of file
+        return _CLASSIFY_MESSAGE_HEAD + notes_content + _CLASSIFY_MESSAGE_TAIL
\ No newline at end of file
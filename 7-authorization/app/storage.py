@@ -1,9 +1,12 @@
+import functools
+
 from cryptography.fernet import Fernet
 from key_value.aio.stores.redis import RedisStore
 from key_value.aio.wrappers.encryption import FernetEncryptionWrapper
 from .config import Config
 
 
+@functools.lru_cache(maxsize=1)
 def get_redis_store() -> RedisStore:
     """Create and return a Redis store instance."""
     return RedisStore(
@@ -12,11 +15,13 @@ def get_redis_store() -> RedisStore:
     )
 
 
+@functools.lru_cache(maxsize=1)
 def get_fernet_cipher() -> Fernet:
     """Create and return a Fernet cipher instance."""
     return Fernet(Config.FERNET_KEY)
 
 
+@functools.lru_cache(maxsize=1)
 def get_encrypted_store() -> FernetEncryptionWrapper:
     """Create and return an encrypted key-value store."""
     store = get_redis_store()